@@ -1,6 +1,111 @@
+import copy
+import hashlib
 import json
 import os
-import random
+import pickle
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+
+# Optional native JSON backend; the stdlib encoder is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode('utf-8')
+
+@dataclass(frozen=True, slots=True)
+class ScreenConfig:
+    """Slotted attribute view over the 'screen' config section."""
+    width: int
+    height: int
+    block_size: int
+    title: str
+
+@dataclass(frozen=True, slots=True)
+class GameplayConfig:
+    """Slotted attribute view over the 'gameplay' config section."""
+    initial_speed: float
+    max_speed: float
+    initial_lives: int
+    speed_increment: float
+    power_up_spawn_chance: float
+
+def _freeze(obj):
+    """Recursively wrap dicts in read-only proxies (lists become tuples)."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+def _thaw(obj):
+    """Recursively convert a frozen config back into mutable dicts/lists."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(value) for value in obj]
+    return obj
+
+def materialize_colors(config):
+    """
+    Build pygame.Color objects from the config's color definitions.
+
+    Called from the game bootstrap rather than at config load so that
+    this module keeps no import-time pygame dependency. Draw calls can
+    then use the values directly without per-frame list conversion.
+
+    Args:
+        config (dict): Merged game configuration
+
+    Returns:
+        dict: Mapping of color name to pygame.Color
+    """
+    import pygame
+    return {name: pygame.Color(*value)
+            for name, value in config.get('colors', {}).items()}
+
+def build_config_views(config):
+    """
+    Build frozen slotted views over the hot config sections.
+
+    Hot paths (drawing, movement, obstacle placement) read these via
+    attribute access instead of repeated nested dict lookups.
+
+    Args:
+        config (dict): Merged game configuration
+
+    Returns:
+        tuple: (ScreenConfig, GameplayConfig)
+    """
+    screen = config['screen']
+    gameplay = config['gameplay']
+    return (
+        ScreenConfig(
+            width=screen['width'],
+            height=screen['height'],
+            block_size=screen['block_size'],
+            title=screen['title']
+        ),
+        GameplayConfig(
+            initial_speed=gameplay['initial_speed'],
+            max_speed=gameplay['max_speed'],
+            initial_lives=gameplay['initial_lives'],
+            speed_increment=gameplay['speed_increment'],
+            power_up_spawn_chance=gameplay['power_up_spawn_chance']
+        )
+    )
 
 class GameConfigManager:
     """
@@ -63,26 +168,104 @@ class GameConfigManager:
         }
     }
 
+    # Read-only view of the defaults, shared by callers that never edit
+    # the config; a mutable copy is only materialized on demand.
+    FROZEN_DEFAULT = _freeze(DEFAULT_CONFIG)
+
     CONFIG_FILE = 'game_config.json'
+    CACHE_FILE = 'game_config.cache'
+
+    # Parse-once cache: merged config keyed on the config file's stat,
+    # so repeated load_config calls skip disk I/O and JSON parsing. The
+    # content hash additionally skips re-parse/re-merge when the file was
+    # rewritten (fresh mtime) with identical contents.
+    _cached = None
+    _cached_stat = None
+    _file_hash = None
 
     @classmethod
     def load_config(cls):
         """
         Load game configuration from file or return default.
 
+        The merged configuration is cached in memory and keyed on the
+        config file's (mtime, size), so repeated calls reuse the parsed
+        result instead of re-reading and re-merging the JSON file.
+
         Returns:
             dict: Game configuration
         """
         try:
             if os.path.exists(cls.CONFIG_FILE):
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    user_config = json.load(f)
-                    # Deep merge default and user config
-                    return cls._deep_merge(cls.DEFAULT_CONFIG.copy(), user_config)
-            return cls.DEFAULT_CONFIG.copy()
+                stat = os.stat(cls.CONFIG_FILE)
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                if cls._cached is not None and cls._cached_stat == stat_key:
+                    return copy.deepcopy(cls._cached)
+
+                # Pickle cache: a previous run already merged this exact
+                # file, so skip the JSON parse and merge entirely.
+                config = cls._read_cache(stat_key)
+                if config is not None:
+                    cls._cached = config
+                    cls._cached_stat = stat_key
+                    return copy.deepcopy(config)
+
+                with open(cls.CONFIG_FILE, 'rb') as f:
+                    data = f.read()
+
+                # File was touched but contents are unchanged: keep the
+                # cached merge and just refresh the stat key.
+                file_hash = hashlib.blake2b(data, digest_size=8).digest()
+                if cls._cached is not None and file_hash == cls._file_hash:
+                    cls._cached_stat = stat_key
+                    return copy.deepcopy(cls._cached)
+
+                user_config = _json_loads(data)
+
+                # Deep merge default and user config
+                config = cls._deep_merge(copy.deepcopy(cls.DEFAULT_CONFIG), user_config)
+                cls._cached = config
+                cls._cached_stat = stat_key
+                cls._file_hash = file_hash
+                cls._write_cache(stat_key, config)
+                return copy.deepcopy(config)
+            return cls.FROZEN_DEFAULT
         except Exception as e:
             print(f"Error loading config: {e}. Using default configuration.")
-            return cls.DEFAULT_CONFIG.copy()
+            return cls.FROZEN_DEFAULT
+
+    @classmethod
+    def _read_cache(cls, stat_key):
+        """
+        Load the merged config from the pickle cache if it matches the
+        given stat key of the JSON file. Returns None on any mismatch
+        or read error.
+        """
+        try:
+            with open(cls.CACHE_FILE, 'rb') as f:
+                cached_key = pickle.load(f)
+                if cached_key == stat_key:
+                    return pickle.load(f)
+        except Exception:
+            pass
+        return None
+
+    @classmethod
+    def _write_cache(cls, stat_key, config):
+        """Persist the merged config keyed by the JSON file's stat."""
+        try:
+            with open(cls.CACHE_FILE, 'wb') as f:
+                pickle.dump(stat_key, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(config, f, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the in-memory config cache (e.g. after saving changes)."""
+        cls._cached = None
+        cls._cached_stat = None
+        cls._file_hash = None
 
     @classmethod
     def save_config(cls, config):
@@ -93,8 +276,9 @@ class GameConfigManager:
             config (dict): Configuration to save
         """
         try:
-            with open(cls.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=4)
+            with open(cls.CONFIG_FILE, 'wb') as f:
+                f.write(_json_dumps(config))
+            cls.invalidate()
             print("Configuration saved successfully.")
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -102,7 +286,10 @@ class GameConfigManager:
     @classmethod
     def _deep_merge(cls, default, update):
         """
-        Recursively merge two dictionaries.
+        Merge two nested dictionaries iteratively.
+
+        Uses an explicit stack of (destination, source) pairs instead of
+        recursion, avoiding per-level call frames and throwaway dicts.
 
         Args:
             default (dict): Default configuration
@@ -111,22 +298,49 @@ class GameConfigManager:
         Returns:
             dict: Merged configuration
         """
-        for key, value in update.items():
-            if isinstance(value, dict):
-                default[key] = cls._deep_merge(default.get(key, {}), value)
-            else:
-                default[key] = value
+        stack = deque([(default, update)])
+        while stack:
+            dst, src = stack.pop()
+
+            # Flat sections (colors, screen, per-difficulty leaves) take
+            # the C-level bulk update instead of the per-item loop.
+            if not any(isinstance(value, dict) for value in src.values()):
+                dst.update(src)
+                continue
+
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    existing = dst.get(key)
+                    if isinstance(existing, dict):
+                        stack.append((existing, value))
+                    else:
+                        dst[key] = value
+                else:
+                    dst[key] = value
         return default
 
     @classmethod
-    def create_config_interface(cls):
+    def create_config_interface(cls, overrides=None):
         """
         Create an interactive configuration interface.
 
+        Args:
+            overrides (dict, optional): Nested configuration overrides.
+                When provided, they are merged and saved in one pass and
+                no interactive prompts are shown, so scripted launches
+                avoid the serial input() round-trips entirely.
+
         Returns:
             dict: Updated configuration
         """
-        config = cls.load_config()
+        # Thaw in case load_config handed back the frozen defaults
+        config = _thaw(cls.load_config())
+
+        if overrides:
+            # Non-interactive path: apply all overrides in a single merge
+            cls._deep_merge(config, overrides)
+            cls.save_config(config)
+            return config
 
         print("\n=== Snake Game Configuration ===")
 
@@ -160,13 +374,53 @@ class GameConfigManager:
         cls.save_config(config)
         return config
 
-def initialize_game_config():
+def parse_config_overrides(assignments):
+    """
+    Build a nested override dict from 'section.key=value' assignments.
+
+    Values are parsed as JSON where possible (numbers, booleans, lists)
+    and fall back to the raw string otherwise.
+
+    Args:
+        assignments (list): Strings like 'screen.width=1024'
+
+    Returns:
+        dict: Nested overrides suitable for _deep_merge
+
+    Raises:
+        ValueError: If an assignment is missing the '=' separator
+    """
+    overrides = {}
+    for assignment in assignments:
+        path, sep, raw = assignment.partition('=')
+        if not sep:
+            raise ValueError(f"Invalid config override (expected key=value): {assignment}")
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw
+
+        node = overrides
+        keys = path.split('.')
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+    return overrides
+
+def initialize_game_config(overrides=None):
     """
     Initialize game configuration, optionally allowing user customization.
 
+    Args:
+        overrides (dict, optional): Nested configuration overrides; when
+            provided, the interactive prompt is skipped entirely.
+
     Returns:
         dict: Game configuration
     """
+    if overrides:
+        return GameConfigManager.create_config_interface(overrides)
+
     # Check if user wants to modify configuration
     modify = input("Would you like to modify game configuration? (y/n): ").lower() == 'y'
 
@@ -1,5 +1,66 @@
 import random
-import pygame
+import functools
+from types import MappingProxyType
+
+# Shared choice tables, built once instead of per call. Weather entries
+# are read-only; mission templates are copied per game (a 'goal' of None
+# is filled in from the game config).
+@functools.cache
+def _weather_pool():
+    """Read-only pool of weather types, built on first use."""
+    return (
+        MappingProxyType({
+            'name': 'Sunny',
+            'color_shift': (50, 50, 0),  # Slight yellow tint
+            'speed_modifier': 1.0
+        }),
+        MappingProxyType({
+            'name': 'Rainy',
+            'color_shift': (-50, -50, 50),  # Blue tint
+            'speed_modifier': 0.8  # Slower movement
+        }),
+        MappingProxyType({
+            'name': 'Windy',
+            'color_shift': (0, 30, -30),  # Green-blue tint
+            'speed_modifier': 1.2  # Faster movement
+        })
+    )
+
+# Integer mission ids, so progress tracking branches on an int compare
+# instead of matching the description string
+MISSION_EAT_APPLES = 1
+MISSION_MAX_SPEED = 2
+MISSION_POWER_UPS = 3
+
+_MISSION_TEMPLATES = (
+    {
+        'type_id': MISSION_EAT_APPLES,
+        'description': 'Eat 5 apples without hitting walls',
+        'goal': 5,
+        'current_progress': 0,
+        'reward': 10
+    },
+    {
+        'type_id': MISSION_MAX_SPEED,
+        'description': 'Reach max speed',
+        'goal': None,
+        'current_progress': 0,
+        'reward': 15
+    },
+    {
+        'type_id': MISSION_POWER_UPS,
+        'description': 'Collect 3 power-ups',
+        'goal': 3,
+        'current_progress': 0,
+        'reward': 20
+    }
+)
+
+@functools.lru_cache(maxsize=4)
+def _grid_cells(cols, rows, block_size):
+    """All grid cell coordinates for a board of the given dimensions."""
+    return tuple((x * block_size, y * block_size)
+                 for x in range(cols) for y in range(rows))
 
 class GameEnhancements:
     @staticmethod
@@ -13,22 +74,22 @@ class GameEnhancements:
         Returns:
             list: Obstacles coordinates
         """
-        obstacles = []
         num_obstacles = random.randint(1, 5)
 
-        for _ in range(num_obstacles):
-            while True:
-                x = random.randint(0, (game.config['screen']['width'] // game.config['screen']['block_size'] - 1)) * game.config['screen']['block_size']
-                y = random.randint(0, (game.config['screen']['height'] // game.config['screen']['block_size'] - 1)) * game.config['screen']['block_size']
+        # Grid constants precomputed once on the game instance
+        block_size = game._bs
+        cols = game._cols
+        rows = game._rows
 
-                # Ensure obstacle doesn't overlap with snake, apple, or other obstacles
-                if ((x, y) not in game.snake and
-                    (x, y) != game.apple and
-                    all((x, y) != (obs_x, obs_y) for obs_x, obs_y in obstacles)):
-                    obstacles.append((x, y))
-                    break
+        # Occupied cells as a set for O(1) overlap checks
+        occupied = set(game.snake_set)
+        occupied.add(game.apple)
 
-        return obstacles
+        # Sample directly from the free cells instead of rejection
+        # sampling, so placement is bounded even on crowded boards.
+        free = [cell for cell in _grid_cells(cols, rows, block_size)
+                if cell not in occupied]
+        return random.sample(free, min(num_obstacles, len(free)))
 
     @staticmethod
     def create_challenge_mode(game):
@@ -41,12 +102,14 @@ class GameEnhancements:
         Returns:
             dict: Challenge mode settings
         """
+        # One RNG draw, bit-sliced into the individual fields
+        bits = random.getrandbits(32)
         challenge_settings = {
-            'time_limit': random.randint(30, 120),  # 30-120 seconds
-            'target_score': random.randint(50, 200),
+            'time_limit': 30 + (bits & 0x7F) % 91,  # 30-120 seconds
+            'target_score': 50 + ((bits >> 7) & 0xFF) % 151,  # 50-200
             'obstacles': True,
-            'moving_walls': random.choice([True, False]),
-            'special_apple_spawn': random.choice([True, False])
+            'moving_walls': bool((bits >> 16) & 1),
+            'special_apple_spawn': bool((bits >> 17) & 1)
         }
 
         return challenge_settings
@@ -62,28 +125,11 @@ class GameEnhancements:
         Returns:
             dict: Mini-mission configuration
         """
-        missions = [
-            {
-                'description': 'Eat 5 apples without hitting walls',
-                'goal': 5,
-                'current_progress': 0,
-                'reward': 10
-            },
-            {
-                'description': 'Reach max speed',
-                'goal': game.config['gameplay']['max_speed'],
-                'current_progress': 0,
-                'reward': 15
-            },
-            {
-                'description': 'Collect 3 power-ups',
-                'goal': 3,
-                'current_progress': 0,
-                'reward': 20
-            }
-        ]
-
-        return random.choice(missions)
+        # Copy the chosen template so progress tracking stays per-game
+        mission = dict(random.choice(_MISSION_TEMPLATES))
+        if mission['goal'] is None:
+            mission['goal'] = game.config['gameplay']['max_speed']
+        return mission
 
     @staticmethod
     def add_weather_effects():
@@ -93,22 +139,4 @@ class GameEnhancements:
         Returns:
             dict: Weather effects configuration
         """
-        weather_types = [
-            {
-                'name': 'Sunny',
-                'color_shift': (50, 50, 0),  # Slight yellow tint
-                'speed_modifier': 1.0
-            },
-            {
-                'name': 'Rainy',
-                'color_shift': (-50, -50, 50),  # Blue tint
-                'speed_modifier': 0.8  # Slower movement
-            },
-            {
-                'name': 'Windy',
-                'color_shift': (0, 30, -30),  # Green-blue tint
-                'speed_modifier': 1.2  # Faster movement
-            }
-        ]
-
-        return random.choice(weather_types)
+        return random.choice(_weather_pool())
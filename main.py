@@ -1,14 +1,21 @@
+import argparse
+import bisect
+import functools
+import heapq
+import io
 import math
 import os
+import struct
 import sys
 import json
 import pygame
 import random
 import logging
+from collections import OrderedDict, deque
+import wave
 import numpy as np
-from scipy.io import wavfile
-from configs import initialize_game_config
-from enhancements import GameEnhancements
+from configs import initialize_game_config, build_config_views, materialize_colors, parse_config_overrides
+from enhancements import GameEnhancements, MISSION_EAT_APPLES, MISSION_MAX_SPEED
 
 # Logging setup
 logging.basicConfig(
@@ -17,12 +24,18 @@ logging.basicConfig(
     filename='snake_game.log'
 )
 
+# Enable to trace mission progress on stdout every frame
+DEBUG_MISSIONS = False
+
 # Enhanced Configuration Management
 class GameConfig:
     """Centralized configuration management for the Snake game."""
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
     BLOCK_SIZE = 20
+    # Integer grid dimensions derived once from the pixel constants
+    GRID_COLS = SCREEN_WIDTH // BLOCK_SIZE
+    GRID_ROWS = SCREEN_HEIGHT // BLOCK_SIZE
     INITIAL_SPEED = 5
     MAX_SPEED = 15
     INITIAL_LIVES = 3
@@ -52,6 +65,13 @@ class GameConfig:
         """Retrieve configuration for a specific difficulty level."""
         return cls.DIFFICULTY_LEVELS.get(difficulty, cls.DIFFICULTY_LEVELS['MEDIUM'])
 
+# Small-integer direction encoding for the snake. Opposites pair up as
+# n ^ 1, so the reversal guard is one xor and one int compare, and the
+# pixel delta per tick is an O(1) tuple index instead of a dict lookup.
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+_B = GameConfig.BLOCK_SIZE
+DIRECTION_DELTAS = ((0, -_B), (0, _B), (-_B, 0), (_B, 0))
+
 # Color Palette
 class Colors:
     BLACK = (0, 0, 0)
@@ -65,11 +85,65 @@ class Colors:
     HOT_PINK = (255, 105, 180)
     LIGHT_BLUE = (100, 149, 237)
 
+@functools.lru_cache(maxsize=4)
+def _placeholder_wav_bytes(duration, amplitude, frequency, sample_rate):
+    """
+    Complete WAV file contents for a sine tone, synthesized once per
+    parameter combination.
+
+    Uses float32 math on a single reused buffer and serializes an int16
+    result through the stdlib wave module, so scipy is not needed just
+    to emit placeholder tones and identical placeholders share one
+    synthesis pass.
+    """
+    n = int(sample_rate * duration)
+    t = np.arange(n, dtype=np.float32)
+    t *= np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(t, out=t)
+    t *= np.float32(32767 * amplitude)
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(t.astype(np.int16).tobytes())
+    return buf.getvalue()
+
+def _write_placeholder_tone(filename, duration, amplitude=1.0, frequency=440, sample_rate=44100):
+    """Write a sine-tone WAV file for missing audio assets."""
+    with open(filename, 'wb') as f:
+        f.write(_placeholder_wav_bytes(duration, amplitude, frequency, sample_rate))
+
+@functools.lru_cache(maxsize=4)
+def _cell_pool(cols, rows, block_size):
+    """
+    Interned grid-cell tuples indexed as [col][row].
+
+    The set of possible cells is bounded by the board geometry, so
+    spawn code can reuse these tuples instead of allocating a fresh
+    (x, y) pair per placement attempt.
+    """
+    return tuple(
+        tuple((x * block_size, y * block_size) for y in range(rows))
+        for x in range(cols)
+    )
+
+@functools.lru_cache(maxsize=4)
+def _all_cells(cols, rows, block_size):
+    """Frozenset of every grid cell, the basis for free-cell tracking."""
+    return frozenset(cell
+                     for column in _cell_pool(cols, rows, block_size)
+                     for cell in column)
+
 class SoundManager:
     """Manage game sound effects and background music."""
     def __init__(self):
         """Initialize sound system."""
-        pygame.mixer.init()
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        # Fix the channel count up front so SDL does not grow the pool
+        # mid-game when effects overlap
+        pygame.mixer.set_num_channels(8)
         self.sounds = {}
         self.music = None
         self.volume = 0.5
@@ -83,47 +157,34 @@ class SoundManager:
             'game_over': 'audio/game_over.wav'
         }
 
-        # Create audio directory if it doesn't exist
+        # Create audio directory if it doesn't exist; one scandir then
+        # covers every per-file existence check below
         os.makedirs('audio', exist_ok=True)
+        present = {entry.name for entry in os.scandir('audio')}
 
         for name, filename in sound_files.items():
+            if os.path.basename(filename) not in present:
+                # Create placeholder sound files that don't exist
+                self.create_placeholder_sound(filename)
             try:
                 sound = pygame.mixer.Sound(filename)
                 sound.set_volume(self.volume)
                 self.sounds[name] = sound
             except pygame.error as e:
-                logging.warning(f"Could not load sound {filename}: {e}")
-                # Optional: create placeholder sound files if they don't exist
-                self.create_placeholder_sound(filename)
+                logging.warning("Could not load sound %s: %s", filename, e)
 
     def create_placeholder_sound(self, filename):
-        """Create a placeholder sound file if it doesn't exist."""
-        import numpy as np
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-        # Only create if file doesn't exist
-        if not os.path.exists(filename):
-            # Generate a simple tone
-            sample_rate = 44100
-            duration = 0.5  # half a second
-            t = np.linspace(0, duration, int(sample_rate * duration), False)
-            tone = np.sin(2 * np.pi * 440 * t)  # 440 Hz tone
-
-            # Scale to 16-bit integers
-            scaled = np.int16(tone * 32767)
-
-            # Write WAV file
-            wavfile.write(filename, sample_rate, scaled)
-            logging.info(f"Created placeholder sound file: {filename}")
+        """Create a placeholder sound file; the caller checks existence."""
+        # Generate a simple 440 Hz tone, half a second long
+        _write_placeholder_tone(filename, duration=0.5)
+        logging.info("Created placeholder sound file: %s", filename)
 
     def play_sound(self, sound_name):
         """Play a specific sound effect."""
         if sound_name in self.sounds:
             self.sounds[sound_name].play()
         else:
-            logging.warning(f"Sound {sound_name} not found")
+            logging.warning("Sound %s not found", sound_name)
 
     def set_volume(self, volume):
         """Set volume for all sounds."""
@@ -132,54 +193,103 @@ class SoundManager:
             sound.set_volume(self.volume)
 
 class HighScoreManager:
-    """Manage high scores with persistent storage."""
+    """Manage high scores with persistent storage.
+
+    Scores are appended to a fixed-width binary log (28 bytes per
+    record), so a save is one small append instead of a full JSON
+    read-sort-rewrite. The legacy highscores.json, if present, is still
+    folded into reads.
+    """
     HIGHSCORE_FILE = 'highscores.json'
+    HIGHSCORE_LOG = 'highscores.log'
+
+    # 16-byte name, unsigned score, timestamp
+    _RECORD = struct.Struct('<16sId')
+
+    # All known entries, loaded from disk once and appended to on save
+    # so repeat reads skip the file parse entirely; _top holds the
+    # descending top ten, maintained incrementally on save
+    _cache = None
+    _top = None
 
     @classmethod
     def save_score(cls, score, username='Player'):
         """Save a new high score."""
         try:
-            # Load existing high scores
-            if os.path.exists(cls.HIGHSCORE_FILE):
-                with open(cls.HIGHSCORE_FILE, 'r') as f:
-                    high_scores = json.load(f)
-            else:
-                high_scores = []
-
-            # Add new score
-            high_scores.append({
-                'name': username,
-                'score': score,
-                'timestamp': pygame.time.get_ticks()
-            })
-
-            # Sort and keep top 10
-            high_scores = sorted(high_scores, key=lambda x: x['score'], reverse=True)[:10]
-
-            # Save back to file
-            with open(cls.HIGHSCORE_FILE, 'w') as f:
-                json.dump(high_scores, f)
+            timestamp = pygame.time.get_ticks()
+            record = cls._RECORD.pack(
+                username.encode('utf-8')[:16].ljust(16, b'\0'),
+                score,
+                timestamp
+            )
+            with open(cls.HIGHSCORE_LOG, 'ab') as f:
+                f.write(record)
+
+            if cls._cache is not None:
+                entry = {
+                    'name': username,
+                    'score': score,
+                    'timestamp': timestamp
+                }
+                cls._cache.append(entry)
+                if cls._top is not None:
+                    # O(log n) insertion into the sorted board instead
+                    # of re-ranking everything on the next read
+                    bisect.insort(cls._top, entry, key=lambda e: -e['score'])
+                    del cls._top[10:]
 
         except Exception as e:
-            logging.error(f"Error saving high score: {e}")
+            logging.error("Error saving high score: %s", e)
+
+    @classmethod
+    def _load_entries(cls):
+        """Read the legacy JSON file and the binary log from disk."""
+        entries = []
+
+        # Legacy JSON file from older versions
+        if os.path.exists(cls.HIGHSCORE_FILE):
+            with open(cls.HIGHSCORE_FILE, 'r') as f:
+                entries.extend(json.load(f))
+
+        # Append-only binary log
+        if os.path.exists(cls.HIGHSCORE_LOG):
+            with open(cls.HIGHSCORE_LOG, 'rb') as f:
+                data = f.read()
+            # Drop any truncated trailing record
+            data = data[:len(data) - len(data) % cls._RECORD.size]
+            for name, score, timestamp in cls._RECORD.iter_unpack(data):
+                entries.append({
+                    'name': name.rstrip(b'\0').decode('utf-8', 'replace'),
+                    'score': score,
+                    'timestamp': timestamp
+                })
+
+        return entries
 
     @classmethod
     def get_high_scores(cls):
         """Retrieve top high scores."""
         try:
-            if os.path.exists(cls.HIGHSCORE_FILE):
-                with open(cls.HIGHSCORE_FILE, 'r') as f:
-                    return json.load(f)
-            return []
+            if cls._cache is None:
+                cls._cache = cls._load_entries()
+            if cls._top is None:
+                cls._top = heapq.nlargest(10, cls._cache, key=lambda x: x['score'])
+            return list(cls._top)
         except Exception as e:
-            logging.error(f"Error reading high scores: {e}")
+            logging.error("Error reading high scores: %s", e)
             return []
 
+# Precomputed jitter table for screen shake: 256 (dx, dy) pairs in
+# [-8, 8], scaled by intensity at use. Avoids two random.randint calls
+# per active frame.
+_SHAKE_LUT = np.random.randint(-8, 9, size=(256, 2), dtype=np.int8)
+
 class ScreenShake:
     def __init__(self):
         self.duration = 0
         self.intensity = 0
         self.offset = (0, 0)
+        self._i = 0
 
     def start(self, duration=20, intensity=5):
         self.duration = duration
@@ -187,16 +297,23 @@ class ScreenShake:
 
     def update(self):
         if self.duration > 0:
+            dx, dy = _SHAKE_LUT[self._i & 255]
+            # Truncate toward zero so positive and negative jitter scale
+            # symmetrically (floor division skews the shake negative)
             self.offset = (
-                random.randint(-self.intensity, self.intensity),
-                random.randint(-self.intensity, self.intensity)
+                int(dx * self.intensity / 8),
+                int(dy * self.intensity / 8)
             )
+            self._i += 1
             self.duration -= 1
         else:
             self.offset = (0, 0)
 
 class BackgroundMusic:
     def __init__(self):
+        # The mixer may not be up yet now that SoundManager is lazy
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
 
         # Music tracks
         self.tracks = {
@@ -208,44 +325,66 @@ class BackgroundMusic:
         self.load_tracks()
 
     def load_tracks(self):
+        # Create audio directory if it doesn't exist; the sound manager
+        # is lazy now, so it may not have run yet
+        os.makedirs('audio', exist_ok=True)
+
+        # One directory listing instead of a stat per track
+        present = {entry.name for entry in os.scandir('audio')}
         for name, path in self.tracks.items():
-            if not os.path.exists(path):
+            if os.path.basename(path) not in present:
                 self.create_placeholder_music(path)
 
     def create_placeholder_music(self, filename):
-        sample_rate = 44100
-        duration = 10
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        melody = np.sin(2 * np.pi * 440 * t) * 0.3
-        wavfile.write(filename, sample_rate, (melody * 32767).astype(np.int16))
+        _write_placeholder_tone(filename, duration=10, amplitude=0.3)
 
     def play(self, track_name, loop=True):
         if self.current_track != track_name:
             pygame.mixer.music.load(self.tracks[track_name])
             pygame.mixer.music.play(-1 if loop else 0)
             self.current_track = track_name
+_DIRS = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+
+# Game-over button layout: (key, label, base color, y offset)
+_GAMEOVER_BUTTONS = (
+    ('restart', 'Restart Game', Colors.GREEN, 10),
+    ('high_scores', 'View High Scores', Colors.BLUE, 50),
+    ('achievements', 'View Achievements', Colors.GOLD, 80),
+    ('exit', 'Exit Game', Colors.RED, 110)
+)
+
+# Arrow key -> integer direction for event-driven steering
+_DIR_MAP = {
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT
+}
+
 class MovingFood:
+    # Unit movement vector per direction, applied without branching
+    _DELTAS = {'UP': (0, -1), 'DOWN': (0, 1), 'LEFT': (-1, 0), 'RIGHT': (1, 0)}
+
     def __init__(self, x, y, speed=2):
         self.x = x
         self.y = y
         self.speed = speed
-        self.direction = random.choice(['UP', 'DOWN', 'LEFT', 'RIGHT'])
+        self.direction = random.choice(_DIRS)
         self.move_counter = 0
+        # Grid cell the food occupies, kept in sync with x/y so the
+        # snake's eat check is a single tuple compare
+        self.cell = (x // GameConfig.BLOCK_SIZE, y // GameConfig.BLOCK_SIZE)
 
     def update(self):
         # Change direction randomly
         if self.move_counter % 30 == 0:
-            self.direction = random.choice(['UP', 'DOWN', 'LEFT', 'RIGHT'])
-
-        # Move food
-        if self.direction == 'UP':
-            self.y = max(0, self.y - self.speed)
-        elif self.direction == 'DOWN':
-            self.y = min(GameConfig.SCREEN_HEIGHT - GameConfig.BLOCK_SIZE, self.y + self.speed)
-        elif self.direction == 'LEFT':
-            self.x = max(0, self.x - self.speed)
-        elif self.direction == 'RIGHT':
-            self.x = min(GameConfig.SCREEN_WIDTH - GameConfig.BLOCK_SIZE, self.x + self.speed)
+            self.direction = random.choice(_DIRS)
+
+        # Move food, clamped to the screen
+        dx, dy = self._DELTAS[self.direction]
+        self.x = min(max(0, self.x + dx * self.speed), GameConfig.SCREEN_WIDTH - GameConfig.BLOCK_SIZE)
+        self.y = min(max(0, self.y + dy * self.speed), GameConfig.SCREEN_HEIGHT - GameConfig.BLOCK_SIZE)
+        self.cell = (self.x // GameConfig.BLOCK_SIZE, self.y // GameConfig.BLOCK_SIZE)
 
         self.move_counter += 1
 
@@ -278,6 +417,9 @@ class PowerUp:
         }
     }
 
+    # Key tuple built once at class definition for random.choice
+    _TYPE_KEYS = tuple(TYPES)
+
     def __init__(self, x, y, power_type):
         """Initialize a power-up with position and type."""
         self.x = x
@@ -285,6 +427,9 @@ class PowerUp:
         self.power_type = power_type
         self.creation_time = pygame.time.get_ticks()
         self.config = self.TYPES[power_type]
+        # Position in the game's power-up list, maintained by the game
+        # for O(1) swap-and-pop removal
+        self.index = None
 
     def apply_effect(self, game):
         """Apply the power-up's effect to the game."""
@@ -295,10 +440,31 @@ class PowerUp:
         if self.config['duration'] > 0:
             game.screen_shake.start(duration=10, intensity=3)
 
-    def is_expired(self):
-        """Check if power-up has expired."""
-        return self.config['duration'] > 0 and \
-               pygame.time.get_ticks() - self.creation_time > self.config['duration']
+    def is_expired(self, now=None):
+        """Check if power-up has expired.
+
+        Args:
+            now (int, optional): Current tick count; callers checking
+                many power-ups should read the clock once and pass it in.
+        """
+        if self.config['duration'] <= 0:
+            return False
+        if now is None:
+            now = pygame.time.get_ticks()
+        return now - self.creation_time > self.config['duration']
+
+# Combined outcome pool for power-up spawn draws: one weighted choice
+# decides both whether a power-up spawns (None) and which type it is.
+_POWER_UP_OUTCOMES = (None,) + PowerUp._TYPE_KEYS
+
+# Apple kind pool for the moving-food draw
+_APPLE_KINDS = ('static', 'moving')
+_APPLE_WEIGHTS = (0.7, 0.3)
+
+@functools.lru_cache(maxsize=8)
+def _spawn_weights(chance, n_types):
+    """Weights matching _POWER_UP_OUTCOMES for a given spawn chance."""
+    return (1.0 - chance,) + (chance / n_types,) * n_types
 
 class AchievementManager:
     """Manage game achievements and tracking."""
@@ -329,6 +495,9 @@ class AchievementManager:
         }
     }
 
+    # Stable (key, achievement) pairs, materialized once
+    _ITEMS = tuple(ACHIEVEMENTS.items())
+
     @classmethod
     def check_achievements(cls, game):
         """
@@ -342,17 +511,33 @@ class AchievementManager:
         """
         unlocked = []
 
+        # Skip the full scan when nothing relevant changed since last check
+        if not getattr(game, '_ach_dirty', True):
+            return unlocked
+        game._ach_dirty = False
+
         # Ensure power_ups_collected is tracked
         if 'power_ups_collected' not in game.achievements:
             game.achievements['power_ups_collected'] = 0
 
-        for key, achievement in cls.ACHIEVEMENTS.items():
+        # Evaluate the conditions inline against hoisted locals instead
+        # of dispatching through the per-achievement lambdas
+        gameplay = game.gameplay_cfg
+        met = {
+            'long_snake': len(game.snake) >= 20,
+            'speed_demon': game.current_speed >= gameplay.max_speed,
+            'power_up_master': game.achievements['power_ups_collected'] >= 10,
+            'survival_master': game.lives == gameplay.initial_lives
+        }
+
+        for key, achievement in cls._ITEMS:
             # Check if achievement condition is met
-            if achievement['condition'](game):
+            if met[key]:
                 # Check if this achievement was already unlocked
                 if not game.achievements.get(f'achievement_{key}_unlocked', False):
                     # Mark as unlocked and add to list
                     game.achievements[f'achievement_{key}_unlocked'] = True
+                    game._achievement_unlocked_count += 1
                     game.score += achievement['reward']
                     unlocked.append(achievement)
 
@@ -360,50 +545,95 @@ class AchievementManager:
 
 class SnakeGame:
 
-    def __init__(self, difficulty='MEDIUM'):
+    def __init__(self, difficulty='MEDIUM', config_overrides=None):
         """Initialize the game with all necessary setup."""
         pygame.init()
 
         # Load dynamic configuration
-        self.config = initialize_game_config()
+        self.config = initialize_game_config(config_overrides)
+
+        # Materialize configured colors into pygame.Color objects once;
+        # the draw code reads these resolved values (falling back to the
+        # built-in palette) instead of converting per frame
+        self.colors = materialize_colors(self.config)
+        self._head_color = self.colors.get('snake_head', Colors.GREEN)
+        self._body_color = self.colors.get('snake_body', Colors.DARK_GREEN)
+        self._apple_color = self.colors.get('apple', Colors.RED)
+
+        # Slotted attribute views over the hot config sections
+        self.screen_cfg, self.gameplay_cfg = build_config_views(self.config)
+
+        # Derived grid constants so per-frame code is attribute-access only
+        self._bs = self.screen_cfg.block_size
+        self._cols = self.screen_cfg.width // self._bs
+        self._rows = self.screen_cfg.height // self._bs
 
         # Challenge mode attributes
         self.challenge_mode = None
         self.challenge_start_time = None
+        self._challenge_deadline = None
         self.current_mission = None
         self.obstacles = []
+        self._obstacle_set = set()
         self.games_since_challenge = 0
 
         # Screen and display setup
         self.screen = pygame.display.set_mode((
-            self.config['screen']['width'],
-            self.config['screen']['height']
+            self.screen_cfg.width,
+            self.screen_cfg.height
         ))
-        pygame.display.set_caption(self.config['screen']['title'])
+        pygame.display.set_caption(self.screen_cfg.title)
         self.clock = pygame.time.Clock()
 
-        # Store difficulty configuration as an instance attribute
-        self.difficulty_config = self.config['difficulty_levels'].get(difficulty, self.config['difficulty_levels']['MEDIUM'])
+        # Only queue the event types the game reads; mouse-motion and
+        # friends are dropped inside SDL instead of being wrapped into
+        # Python objects and skipped here
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self._EVENT_TYPES))
+
+        # Store difficulty name and configuration as instance attributes
+        if difficulty not in self.config['difficulty_levels']:
+            difficulty = 'MEDIUM'
+        self.difficulty = difficulty
+        self.difficulty_config = self.config['difficulty_levels'][difficulty]
 
-        # Sound management
-        self.sound_manager = SoundManager()
+        # Sound manager and fonts are cached properties, constructed on
+        # first use so startup skips mixer init and font parsing
 
-        # Fonts
-        self.title_font = pygame.font.Font(None, 64)
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        # LRU cache of rendered text surfaces keyed by (font, text,
+        # color), so unchanged HUD strings skip FreeType rasterization
+        self._text_cache = OrderedDict()
+
+        # Pre-filled block tiles keyed by color, blitted in batches
+        self._tiles = {}
+
+        # Pause overlay and composed game-over background (keyed on the
+        # score pair it was built for), both built on first use
+        self._pause_overlay = None
+        self._gameover_bg = None
+
+        # Filled in by draw_game_over_screen; empty means no buttons yet
+        self.game_over_buttons = {}
+
+        # Rects pushed to the display last frame, for dirty-rect updates
+        self._prev_dirty = None
+
+        # Frame timestamp, refreshed once per main-loop iteration
+        self._now = pygame.time.get_ticks()
 
         # Game state tracking
         self.score = 0
         self.high_score = 0
 
-        # Use difficulty-specific configuration
+        # Use difficulty-specific configuration; per-eat constants are
+        # hoisted into plain attributes so the hot path skips the dict
         self.lives = self.difficulty_config['lives']
         self.current_speed = self.difficulty_config['initial_speed']
         self.power_up_chance = self.difficulty_config.get('power_up_chance', 0.3)
+        self._apple_score = self.difficulty_config.get('apple_score', 1)
 
         self.is_invincible = False
-        self.invincibility_timer = 0
+        self._invincibility_end = 0
 
         # Game elements setup
         self.screen_shake = ScreenShake()
@@ -414,11 +644,15 @@ class SnakeGame:
         # Challenge mode setup
         self.challenge_mode = None
         self.obstacles = []
+        self._obstacle_set = set()
         self.current_mission = None
 
-        # Power-up system
+        # Power-up system; the dict mirrors the list keyed by position
+        # so pickup checks are a single hash probe
         self.power_ups = []
-        self.power_up_spawn_timer = 0
+        self._power_ups_by_pos = {}
+        self._frame = 0
+        self._schedule_next_spawn()
 
         # Achievements tracking
         self.achievements = {
@@ -428,12 +662,74 @@ class SnakeGame:
             'power_ups_collected': 0
         }
 
+        # Unlock bookkeeping so hot paths avoid rescanning the dict:
+        # _ach_dirty gates check_achievements, the counter replaces the
+        # startswith scan in initialize_challenge_mode
+        self._achievement_unlocked_count = 0
+        self._ach_dirty = True
+
+        # Composite achievements-page surface, keyed on unlock count
+        self._ach_page_cache = None
+
         # Game modes
         self.game_state = 'START'
 
+        # Per-state KEYDOWN dispatch: one dict lookup per event replaces
+        # the nested if/elif chains that handle_events used to walk
+        playing_keys = {key: functools.partial(self._steer, direction)
+                        for key, direction in _DIR_MAP.items()}
+        playing_keys[pygame.K_p] = self._pause
+        self._key_handlers = {
+            'START': {
+                pygame.K_SPACE: self.reset_game,
+                pygame.K_a: self.display_achievements_page,
+                pygame.K_d: lambda: self.cycle_difficulty()
+            },
+            'GAME_OVER': {
+                pygame.K_SPACE: self._restart_from_game_over,
+                pygame.K_h: self.show_high_scores,
+                pygame.K_a: self.display_achievements_page,
+                pygame.K_ESCAPE: self._quit
+            },
+            'PLAYING': playing_keys,
+            'PAUSED': {
+                pygame.K_p: self._resume,
+                pygame.K_m: self._toggle_mute
+            }
+        }
+
+        # Game-over button clicks, keyed like self.game_over_buttons
+        self._click_handlers = {
+            'restart': self._restart_from_game_over,
+            'high_scores': self.show_high_scores,
+            'achievements': self.display_achievements_page,
+            'exit': self._quit
+        }
+
         # Initialize game
         self.reset_game()
 
+    @functools.cached_property
+    def sound_manager(self):
+        """Sound effects manager, constructed on first use."""
+        return SoundManager()
+
+    @functools.cached_property
+    def title_font(self):
+        return pygame.font.Font(None, 64)
+
+    @functools.cached_property
+    def font(self):
+        return pygame.font.Font(None, 36)
+
+    @functools.cached_property
+    def small_font(self):
+        return pygame.font.Font(None, 24)
+
+    @functools.cached_property
+    def score_font(self):
+        return pygame.font.Font(None, 48)
+
     def initialize_challenge_mode(self):
         """
         Determines whether to start challenge mode based on various game factors
@@ -464,14 +760,16 @@ class SnakeGame:
             base_probability += 0.05
 
         # Factor 4: Achievement progress
-        achievement_count = sum(1 for key in self.achievements if key.startswith('achievement_') and self.achievements[key])
+        achievement_count = self._achievement_unlocked_count
         if achievement_count > 2:  # Player has some experience
             base_probability += 0.1
 
         # Calculate difficulty multiplier based on player skill
         difficulty_multiplier = 1.0
-        if hasattr(self, 'current_speed') and self.current_speed > self.config['gameplay']['initial_speed']:
-            speed_factor = (self.current_speed - self.config['gameplay']['initial_speed']) / (self.config['gameplay']['max_speed'] - self.config['gameplay']['initial_speed'])
+        gameplay = self.gameplay_cfg
+        if hasattr(self, 'current_speed') and self.current_speed > gameplay.initial_speed:
+            speed_factor = ((self.current_speed - gameplay.initial_speed)
+                            / (gameplay.max_speed - gameplay.initial_speed))
             difficulty_multiplier += speed_factor * 0.5  # Up to 50% harder based on speed
 
         # Ensure reasonable bounds
@@ -482,10 +780,10 @@ class SnakeGame:
 
         if should_start:
             self.games_since_challenge = 0
-            logging.info(f"Starting challenge mode with difficulty multiplier: {difficulty_multiplier}")
+            logging.info("Starting challenge mode with difficulty multiplier: %s", difficulty_multiplier)
         else:
             self.games_since_challenge += 1
-            logging.info(f"Not starting challenge mode. Games since last challenge: {self.games_since_challenge}")
+            logging.info("Not starting challenge mode. Games since last challenge: %s", self.games_since_challenge)
 
         return should_start, difficulty_multiplier
 
@@ -536,61 +834,78 @@ class SnakeGame:
                 screen.blit(achievement_text, achievement_rect)
                 y_offset += 30
 
-    def display_achievements_page(self):
+    def _build_achievements_page(self):
         """
-        Create a dedicated achievements page/screen.
-        Displays all possible achievements with their status.
+        Compose the achievements page into a single surface.
+
+        The composite is cached keyed on the number of unlocks, so
+        revisiting the page is one cached-surface lookup and redrawing
+        it is a single blit per frame.
         """
-        while True:
-            self.screen.fill(Colors.BLACK)
+        cached = self._ach_page_cache
+        if cached is not None and cached[0] == self._achievement_unlocked_count:
+            return cached[1]
 
-            # Achievements Title
-            title = self.title_font.render('Achievements', True, Colors.GREEN)
-            title_rect = title.get_rect(center=(GameConfig.SCREEN_WIDTH//2, 100))
-            self.screen.blit(title, title_rect)
+        page = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        page.fill(Colors.BLACK)
 
-            # Iterate through all possible achievements
-            y_offset = 200
-            for key, achievement in AchievementManager.ACHIEVEMENTS.items():
-                # Check if achievement is unlocked
-                is_unlocked = self.achievements.get(f'achievement_{key}_unlocked', False)
+        # Achievements Title
+        title = self.title_font.render('Achievements', True, Colors.GREEN)
+        page.blit(title, title.get_rect(center=(GameConfig.SCREEN_WIDTH//2, 100)))
 
-                # Choose color based on unlock status
-                text_color = Colors.GOLD if is_unlocked else Colors.GRAY
+        # Iterate through all possible achievements
+        y_offset = 200
+        for key, achievement in AchievementManager.ACHIEVEMENTS.items():
+            # Check if achievement is unlocked
+            is_unlocked = self.achievements.get(f'achievement_{key}_unlocked', False)
 
-                # Render achievement name
-                achievement_text = self.font.render(
-                    f"{achievement['name']}: {achievement['description']}",
-                    True,
-                    text_color
-                )
+            # Choose color based on unlock status
+            text_color = Colors.GOLD if is_unlocked else Colors.GRAY
 
-                # Add unlock status
-                status_text = self.small_font.render(
-                    'Unlocked' if is_unlocked else 'Locked',
-                    True,
-                    Colors.GREEN if is_unlocked else Colors.RED
-                )
+            # Render achievement name
+            achievement_text = self.font.render(
+                f"{achievement['name']}: {achievement['description']}",
+                True,
+                text_color
+            )
 
-                # Position achievement text
-                achievement_rect = achievement_text.get_rect(
-                    center=(GameConfig.SCREEN_WIDTH//2, y_offset)
-                )
-                status_rect = status_text.get_rect(
-                    center=(GameConfig.SCREEN_WIDTH//2, y_offset + 30)
-                )
+            # Add unlock status
+            status_text = self.small_font.render(
+                'Unlocked' if is_unlocked else 'Locked',
+                True,
+                Colors.GREEN if is_unlocked else Colors.RED
+            )
+
+            page.blit(achievement_text, achievement_text.get_rect(
+                center=(GameConfig.SCREEN_WIDTH//2, y_offset)
+            ))
+            page.blit(status_text, status_text.get_rect(
+                center=(GameConfig.SCREEN_WIDTH//2, y_offset + 30)
+            ))
+
+            y_offset += 80
+
+        # Back instructions
+        back_text = self.small_font.render('Press SPACE to go back', True, Colors.GRAY)
+        page.blit(back_text, back_text.get_rect(
+            center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT - 100)
+        ))
 
-                # Render texts
-                self.screen.blit(achievement_text, achievement_rect)
-                self.screen.blit(status_text, status_rect)
+        self._ach_page_cache = (self._achievement_unlocked_count, page)
+        return page
 
-                y_offset += 80
+    def display_achievements_page(self):
+        """
+        Create a dedicated achievements page/screen.
+        Displays all possible achievements with their status.
+        """
+        page = self._build_achievements_page()
 
-            # Back instructions
-            back_text = self.small_font.render('Press SPACE to go back', True, Colors.GRAY)
-            back_rect = back_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT - 100))
-            self.screen.blit(back_text, back_rect)
+        # Full-screen draw: force a full repaint when play resumes
+        self._prev_dirty = None
 
+        while True:
+            self.screen.blit(page, (0, 0))
             pygame.display.update()
 
             # Handle events
@@ -610,15 +925,19 @@ class SnakeGame:
         # Generate challenge mode settings
         self.challenge_mode = GameEnhancements.create_challenge_mode(self)
 
-        # Add dynamic obstacles if enabled
+        # Add dynamic obstacles if enabled; the set shadows the list
+        # for O(1) collision membership
         if self.challenge_mode.get('obstacles', False):
             self.obstacles = GameEnhancements.add_dynamic_obstacles(self)
+            self._obstacle_set = set(self.obstacles)
 
         # Generate a mini-mission
         self.current_mission = GameEnhancements.create_mini_missions(self)
 
-        # Track challenge start time
+        # Track challenge start time and precompute the deadline so the
+        # per-frame check is a single tick comparison
         self.challenge_start_time = pygame.time.get_ticks()
+        self._challenge_deadline = self.challenge_start_time + self.challenge_mode['time_limit'] * 1000
 
         # Optional: Additional challenge mode modifications
         if self.challenge_mode.get('moving_walls', False):
@@ -639,22 +958,47 @@ class SnakeGame:
 
     def draw_obstacles(self):
         """Draw obstacles on the game board."""
-        for obstacle in self.obstacles:
-            pygame.draw.rect(self.screen, Colors.GRAY,
-                            (obstacle[0], obstacle[1],
-                            self.config['screen']['block_size'],
-                            self.config['screen']['block_size']))
+        gray_tile = self._tile(Colors.GRAY)
+        self.screen.blits([(gray_tile, obstacle) for obstacle in self.obstacles])
 
     def check_obstacle_collision(self):
         """Check if snake collides with obstacles."""
         head = self.snake[-1]
-        return head in self.obstacles
+        return head in self._obstacle_set
+
+    def _tile(self, color):
+        """Return the cached BLOCK_SIZE surface filled with color."""
+        tile = self._tiles.get(color)
+        if tile is None:
+            # convert() matches the display format so blits take SDL's
+            # fast copy path
+            tile = pygame.Surface((GameConfig.BLOCK_SIZE, GameConfig.BLOCK_SIZE)).convert()
+            tile.fill(color)
+            self._tiles[color] = tile
+        return tile
+
+    def _render_cached(self, font, text, color):
+        """Render text through a surface cache; repeated strings reuse
+        their surface instead of re-rasterizing every frame."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            cache[key] = surf
+            # Churning strings (scores, speeds) would otherwise grow the
+            # cache without bound over a long session
+            if len(cache) > 256:
+                cache.pop(next(iter(cache)))
+        else:
+            cache.move_to_end(key)
+        return surf
 
     def set_invincibility(self, state):
-        """Set invincibility state and timer."""
+        """Set invincibility state and schedule its end time."""
         self.is_invincible = state
         if state:
-            self.invincibility_timer = pygame.time.get_ticks()
+            self._invincibility_end = self._now + 3000  # 3 seconds
 
     def reset_game(self):
         """Reset the game state to initial conditions."""
@@ -667,23 +1011,39 @@ class SnakeGame:
         center_y = GameConfig.SCREEN_HEIGHT // 2
 
         # Initial snake with 3 segments
-        self.snake = [
+        self.snake = deque([
             (center_x - GameConfig.BLOCK_SIZE * 2, center_y),
             (center_x - GameConfig.BLOCK_SIZE, center_y),
             (center_x, center_y)
-        ]
+        ])
+        # Shadow set mirroring the body for O(1) membership tests; the
+        # counter tracks cells the body currently occupies twice, so the
+        # tail pop only scans the deque while duplicates exist
+        self.snake_set = set(self.snake)
+        self._self_collision = False
+        self._dup_cells = 0
+
+        # Cells open for spawning, kept in sync as the snake moves and
+        # power-ups come and go, so spawns sample directly instead of
+        # rejection-looping over random cells
+        self._board_cells = _all_cells(
+            GameConfig.GRID_COLS, GameConfig.GRID_ROWS, GameConfig.BLOCK_SIZE)
+        self.free_cells = set(self._board_cells)
+        self.free_cells -= self.snake_set
 
         # Initial direction
-        self.direction = 'RIGHT'
+        self.direction = RIGHT
 
         # Generate first apple
         self.apple = self.generate_apple()
 
         # Reset power-ups
         self.power_ups = []
-        self.power_up_spawn_timer = 0
+        self._power_ups_by_pos = {}
+        self._frame = 0
+        self._schedule_next_spawn()
         self.is_invincible = False
-        self.invincibility_timer = 0
+        self._invincibility_end = 0
 
         # Restore challenge mode tracking
         self.games_since_challenge = previous_games_since_challenge
@@ -707,160 +1067,189 @@ class SnakeGame:
             self.score = 0
 
             # Use gameplay configuration for initial speed
-            self.current_speed = self.config['gameplay']['initial_speed']
+            self.current_speed = self.gameplay_cfg.initial_speed
 
             # Use gameplay configuration for lives
-            self.lives = self.config['gameplay']['initial_lives']
+            self.lives = self.gameplay_cfg.initial_lives
 
         # Reset game state
         self.game_state = 'PLAYING'
 
-    def generate_power_up(self):
+    def _draw_power_up_type(self, chance):
+        """One weighted draw combining the spawn decision and the type.
+
+        Returns a power-up type key, or None when nothing should spawn.
+        """
+        weights = _spawn_weights(chance, len(PowerUp._TYPE_KEYS))
+        return random.choices(_POWER_UP_OUTCOMES, weights=weights)[0]
+
+    def _schedule_next_spawn(self):
+        """Draw the frame of the next timed power-up spawn.
+
+        The old timer rolled a 20% Bernoulli trial every 50 frames;
+        sampling the inter-arrival gap (mean 250 frames) once gives the
+        same spawn rate without per-trial RNG calls.
+        """
+        self._next_spawn_frame = self._frame + math.ceil(
+            random.expovariate(0.2 / 50))
+
+    def generate_power_up(self, power_type=None):
         """Generate a random power-up on the map."""
         # Ensure tracking attribute exists
         if 'power_ups_collected' not in self.achievements:
             self.achievements['power_ups_collected'] = 0
 
-        while True:
-            x = random.randint(0, (GameConfig.SCREEN_WIDTH // GameConfig.BLOCK_SIZE - 1)) * GameConfig.BLOCK_SIZE
-            y = random.randint(0, (GameConfig.SCREEN_HEIGHT // GameConfig.BLOCK_SIZE - 1)) * GameConfig.BLOCK_SIZE
-
-            # Ensure power-up doesn't appear on snake body or existing power-ups
-            if (x, y) not in self.snake and \
-            not any(pu.x == x and pu.y == y for pu in self.power_ups):
-                # Randomly select power-up type
-                power_type = random.choice(list(PowerUp.TYPES.keys()))
-                power_up = PowerUp(x, y, power_type)
-                self.power_ups.append(power_up)
-                break
+        if power_type is None:
+            power_type = random.choice(PowerUp._TYPE_KEYS)
+
+        if not self.free_cells:
+            return
+
+        # Sample straight from the maintained free cells; the cell is
+        # reserved until the power-up is collected
+        cell = random.choice(tuple(self.free_cells))
+        self.free_cells.discard(cell)
+        power_up = PowerUp(cell[0], cell[1], power_type)
+        power_up.index = len(self.power_ups)
+        self.power_ups.append(power_up)
+        self._power_ups_by_pos[cell] = power_up
 
     def generate_apple(self):
         """Generate a new apple at a random location not occupied by the snake."""
-        while True:
-            # Calculate grid positions
-            x = random.randint(0, (GameConfig.SCREEN_WIDTH // GameConfig.BLOCK_SIZE - 1)) * GameConfig.BLOCK_SIZE
-            y = random.randint(0, (GameConfig.SCREEN_HEIGHT // GameConfig.BLOCK_SIZE - 1)) * GameConfig.BLOCK_SIZE
+        # Board completely covered (snake plus reserved power-up cells):
+        # there is nowhere left to spawn, so end the run instead of
+        # raising from the empty draw. The head cell keeps self.apple a
+        # valid coordinate for any rendering still in flight.
+        if not self.free_cells:
+            self.game_state = 'GAME_OVER'
+            return self.snake[-1]
 
-            # Ensure apple doesn't appear on snake body or power-ups
-            if random.random() < 0.3:  # 30% chance for moving food
-                return MovingFood(x, y)
-            return (x, y)
+        # Sample straight from the maintained free cells; no retry loop
+        cell = random.choice(tuple(self.free_cells))
+
+        # 30% chance for moving food
+        if random.choices(_APPLE_KINDS, weights=_APPLE_WEIGHTS)[0] == 'moving':
+            return MovingFood(cell[0], cell[1])
+        return cell
 
     def draw_game(self):
         """Render all game elements with screen shake effect."""
         self.screen_shake.update()
         offset_x, offset_y = self.screen_shake.offset
 
+        # Frame timestamp cached by the main loop
+        flash = (self._now % 500) < 250
+
         self.screen.fill(Colors.BLACK)
 
         # Draw obstacles if in challenge mode
         if self.obstacles:
             self.draw_obstacles()
 
-        # Draw all game elements with offset
-            # Draw snake with offset
+        # Batch all block blits into a single SDL call
+        blits = []
+
+        # Snake with offset; tiles are resolved once per frame instead
+        # of re-deciding the color for every segment
+        if self.is_invincible:
+            head_tile = body_tile = self._tile(Colors.GOLD if flash else self._head_color)
+        else:
+            head_tile = self._tile(self._head_color)
+            body_tile = self._tile(self._body_color)
+        head_index = len(self.snake) - 1
         for i, (x, y) in enumerate(self.snake):
-            body_color = Colors.GREEN if i == len(self.snake) - 1 else Colors.DARK_GREEN
-            if self.is_invincible:
-                body_color = Colors.GOLD if pygame.time.get_ticks() % 500 < 250 else Colors.GREEN
-            pygame.draw.rect(self.screen, body_color,
-                            (x + offset_x, y + offset_y, GameConfig.BLOCK_SIZE, GameConfig.BLOCK_SIZE))
+            blits.append((head_tile if i == head_index else body_tile,
+                          (x + offset_x, y + offset_y)))
 
-        # Draw apple with offset
+        # Apple with offset
         if isinstance(self.apple, MovingFood):
             self.apple.update()
             apple_x, apple_y = self.apple.x, self.apple.y
         else:
             apple_x, apple_y = self.apple[0], self.apple[1]
-        pygame.draw.rect(self.screen, Colors.RED,
-                        (apple_x + offset_x, apple_y + offset_y, GameConfig.BLOCK_SIZE, GameConfig.BLOCK_SIZE))
+        blits.append((self._tile(self._apple_color), (apple_x + offset_x, apple_y + offset_y)))
 
-        # Draw power-ups with offset
+        # Power-ups with offset
         for power_up in self.power_ups:
-            pygame.draw.rect(self.screen, power_up.config['color'],
-                            (power_up.x + offset_x, power_up.y + offset_y,
-                            GameConfig.BLOCK_SIZE, GameConfig.BLOCK_SIZE))
+            blits.append((self._tile(power_up.config['color']),
+                          (power_up.x + offset_x, power_up.y + offset_y)))
+
+        self.screen.blits(blits)
 
-        # Draw UI elements (no offset)
-        score_text = self.font.render(f'Score: {self.score} High Score: {self.high_score}', True, Colors.WHITE)
-        lives_text = self.font.render(f'Lives: {self.lives}', True, Colors.WHITE)
-        speed_text = self.small_font.render(f'Speed: {self.current_speed:.1f}', True, Colors.WHITE)
+        # Draw UI elements (no offset); surfaces are cached and only
+        # re-rendered when the underlying value changes
+        score_text = self._render_cached(self.font, f'Score: {self.score} High Score: {self.high_score}', Colors.WHITE)
+        lives_text = self._render_cached(self.font, f'Lives: {self.lives}', Colors.WHITE)
+        speed_text = self._render_cached(self.small_font, f'Speed: {self.current_speed:.1f}', Colors.WHITE)
 
         if self.is_invincible:
-            invincible_text = self.small_font.render('INVINCIBLE', True, Colors.GOLD)
+            invincible_text = self._render_cached(self.small_font, 'INVINCIBLE', Colors.GOLD)
             self.screen.blit(invincible_text, (10, 120))
 
         self.screen.blit(score_text, (10, 10))
         self.screen.blit(lives_text, (10, 50))
         self.screen.blit(speed_text, (10, 90))
 
-        pygame.display.update()
+        # Dirty-rect update: push only the cells touched this frame and
+        # last (to erase old positions) plus the HUD strip. While the
+        # screen shakes everything moves, so fall back to a full flip.
+        bs = GameConfig.BLOCK_SIZE
+        dirty = [pygame.Rect(pos, (bs, bs)) for _, pos in blits]
+        dirty.append(pygame.Rect(0, 0, 420, 150))  # HUD area
 
-    def handle_events(self):
-        """Process pygame events and handle game controls."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        if offset_x or offset_y or self._prev_dirty is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._prev_dirty + dirty)
+        # While shaking everything is dirty; force a full flip next frame
+        self._prev_dirty = None if (offset_x or offset_y) else dirty
 
-            if self.game_state == 'START':
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        self.reset_game()
-                    elif event.key == pygame.K_a:
-                        self.display_achievements_page()
-                    elif event.key == pygame.K_d:
-                        self.cycle_difficulty()
+    def _steer(self, direction):
+        """Turn the snake unless the new direction reverses it."""
+        if self.direction != (direction ^ 1):
+            self.direction = direction
 
-            elif self.game_state == 'GAME_OVER':
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_pos = pygame.mouse.get_pos()
-
-                    if hasattr(self, 'game_over_buttons'):
-                        if self.game_over_buttons['restart'].collidepoint(mouse_pos):
-                            HighScoreManager.save_score(self.score)
-                            self.reset_game()
-                        elif self.game_over_buttons['high_scores'].collidepoint(mouse_pos):
-                            self.show_high_scores()
-                        elif self.game_over_buttons['achievements'].collidepoint(mouse_pos):
-                            self.display_achievements_page()
-                        elif self.game_over_buttons['exit'].collidepoint(mouse_pos):
-                            pygame.quit()
-                            sys.exit()
+    def _pause(self):
+        self.game_state = 'PAUSED'
 
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        HighScoreManager.save_score(self.score)
-                        self.reset_game()
-                    elif event.key == pygame.K_h:
-                        self.show_high_scores()
-                    elif event.key == pygame.K_a:
-                        self.display_achievements_page()
-                    elif event.key == pygame.K_ESCAPE:
-                        pygame.quit()
-                        sys.exit()
-
-            elif self.game_state == 'PLAYING':
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        self.game_state = 'PAUSED'
-
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_UP] and self.direction != 'DOWN':
-                    self.direction = 'UP'
-                elif keys[pygame.K_DOWN] and self.direction != 'UP':
-                    self.direction = 'DOWN'
-                elif keys[pygame.K_LEFT] and self.direction != 'RIGHT':
-                    self.direction = 'LEFT'
-                elif keys[pygame.K_RIGHT] and self.direction != 'LEFT':
-                    self.direction = 'RIGHT'
+    def _resume(self):
+        self.game_state = 'PLAYING'
 
-            elif self.game_state == 'PAUSED':
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_p:
-                        self.game_state = 'PLAYING'
-                    elif event.key == pygame.K_m:
-                        self.sound_manager.set_volume(0 if self.sound_manager.volume > 0 else 0.5)
+    def _toggle_mute(self):
+        self.sound_manager.set_volume(0 if self.sound_manager.volume > 0 else 0.5)
+
+    def _restart_from_game_over(self):
+        HighScoreManager.save_score(self.score)
+        self.reset_game()
+
+    @staticmethod
+    def _quit():
+        pygame.quit()
+        sys.exit()
+
+    # Event types handle_events cares about; SDL filters the rest out
+    # before they are wrapped in Python event objects
+    _EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+    def handle_events(self):
+        """Process pygame events and handle game controls."""
+        for event in pygame.event.get(self._EVENT_TYPES):
+            if event.type == pygame.QUIT:
+                self._quit()
+
+            if event.type == pygame.KEYDOWN:
+                handlers = self._key_handlers.get(self.game_state)
+                if handlers:
+                    handler = handlers.get(event.key)
+                    if handler is not None:
+                        handler()
+            elif (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                    and self.game_state == 'GAME_OVER'):
+                mouse_pos = pygame.mouse.get_pos()
+                for name, rect in self.game_over_buttons.items():
+                    if rect.collidepoint(mouse_pos):
+                        self._click_handlers[name]()
+                        break
 
     def move_snake(self):
         """
@@ -869,26 +1258,28 @@ class SnakeGame:
         head = self.snake[-1]
 
         # Calculate new head position
-        if self.direction == 'UP':
-            new_head = (head[0], head[1] - GameConfig.BLOCK_SIZE)
-        elif self.direction == 'DOWN':
-            new_head = (head[0], head[1] + GameConfig.BLOCK_SIZE)
-        elif self.direction == 'LEFT':
-            new_head = (head[0] - GameConfig.BLOCK_SIZE, head[1])
-        elif self.direction == 'RIGHT':
-            new_head = (head[0] + GameConfig.BLOCK_SIZE, head[1])
+        dx, dy = DIRECTION_DELTAS[self.direction]
+        new_head = (head[0] + dx, head[1] + dy)
+
+        # Record self-collision before the head enters the shadow set;
+        # if the cell is already occupied the body now holds it twice
+        # (an invincible snake passes through itself)
+        self._self_collision = new_head in self.snake_set
+        if self._self_collision:
+            self._dup_cells += 1
 
         # Add new head
         self.snake.append(new_head)
+        self.snake_set.add(new_head)
+        self.free_cells.discard(new_head)
 
         # Collision detection with more precise overlap checking
         is_apple_eaten = False
         if isinstance(self.apple, MovingFood):
-            # Check for overlap within the block size
-            is_apple_eaten = (
-                abs(new_head[0] - self.apple.x) < GameConfig.BLOCK_SIZE and
-                abs(new_head[1] - self.apple.y) < GameConfig.BLOCK_SIZE
-            )
+            # Compare grid cells; the food keeps its cell in sync as it
+            # moves, so this is one tuple compare instead of two abs tests
+            is_apple_eaten = (new_head[0] // GameConfig.BLOCK_SIZE,
+                              new_head[1] // GameConfig.BLOCK_SIZE) == self.apple.cell
         else:
             # Existing tuple-based collision
             is_apple_eaten = new_head == self.apple
@@ -899,13 +1290,12 @@ class SnakeGame:
             self.sound_manager.play_sound('eat')
 
             # Increase score based on difficulty level
-            apple_score = self.difficulty_config.get('apple_score', 1)
-            self.score += apple_score
+            self.score += self._apple_score
 
             # Mission progress tracking
             if self.current_mission:
                 # Mission: Eat specific number of apples
-                if self.current_mission['description'] == 'Eat 5 apples without hitting walls':
+                if self.current_mission['type_id'] == MISSION_EAT_APPLES:
                     self.current_mission['current_progress'] += 1
 
                     # Check if mission is completed
@@ -917,6 +1307,7 @@ class SnakeGame:
 
             # Achievements tracking
             self.achievements['total_apples_eaten'] += 1
+            self._ach_dirty = True
 
             # Speed increase logic
             self.current_speed = min(self.current_speed + 0.5, GameConfig.MAX_SPEED)
@@ -930,7 +1321,7 @@ class SnakeGame:
             # Challenge mode: check for specific mission tracking
             if self.challenge_mode:
                 # Example: Reach max speed mission
-                if self.current_mission and self.current_mission['description'] == 'Reach max speed':
+                if self.current_mission and self.current_mission['type_id'] == MISSION_MAX_SPEED:
                     if self.current_speed >= self.current_mission['goal']:
                         self.current_mission['current_progress'] = self.current_mission['goal']
                         print("Mission Completed: Max Speed Reached!")
@@ -939,28 +1330,47 @@ class SnakeGame:
             # Generate new apple
             self.apple = self.generate_apple()
 
-            # Chance to spawn power-up
-            if random.random() < self.power_up_chance:
-                self.generate_power_up()
+            # Chance to spawn power-up; the draw also picks the type
+            power_type = self._draw_power_up_type(self.power_up_chance)
+            if power_type is not None:
+                self.generate_power_up(power_type)
         else:
-            # Remove tail if no apple eaten
-            self.snake.pop(0)
-
-        # Power-up spawn timer
-        self.power_up_spawn_timer += 1
-        if self.power_up_spawn_timer >= 50:  # Spawn power-up every 50 frames
-            self.power_up_spawn_timer = 0
-            if random.random() < 0.2:  # 20% chance
-                self.generate_power_up()
-
-        # Manage invincibility timer
-        if self.is_invincible:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.invincibility_timer > 3000:  # 3 seconds of invincibility
-                self.is_invincible = False
+            # Remove tail if no apple eaten; the vacated cell reopens
+            # for spawning unless a power-up still sits there. The board
+            # check keeps off-board tails (grow_snake can extend past an
+            # edge) out of the spawn pool.
+            tail = self.snake.popleft()
+            if self._dup_cells and tail in self.snake:
+                # Another segment still occupies this cell; keep it in
+                # the shadow set and drop one duplicate
+                self._dup_cells -= 1
+            else:
+                self.snake_set.discard(tail)
+                if tail not in self._power_ups_by_pos and tail in self._board_cells:
+                    self.free_cells.add(tail)
+
+            # Chasing the tail is safe: the head entered the cell the
+            # tail vacated this same tick, so the flag recorded before
+            # the pop is a false positive unless another segment still
+            # occupies that cell
+            if self._self_collision and tail == new_head:
+                if not self._dup_cells or self.snake.count(new_head) < 2:
+                    self._self_collision = False
+
+        # Timed power-up spawn; the next spawn frame was drawn up front
+        # from the inter-arrival distribution, so each frame costs one
+        # increment and one compare
+        self._frame += 1
+        if self._frame >= self._next_spawn_frame:
+            self.generate_power_up()
+            self._schedule_next_spawn()
+
+        # Manage invincibility timer against the scheduled end time
+        if self.is_invincible and self._now > self._invincibility_end:
+            self.is_invincible = False
 
         # Optional: Additional debug or logging
-        if self.challenge_mode and self.current_mission:
+        if DEBUG_MISSIONS and self.challenge_mode and self.current_mission:
             print(f"Current Mission Progress: {self.current_mission['current_progress']}/{self.current_mission['goal']}")
 
     def grow_snake(self):
@@ -968,63 +1378,65 @@ class SnakeGame:
         Safely grow the snake by one segment.
         Adds the new segment to the tail, ensuring no immediate collision.
         """
+        # Extend opposite to the travel direction, reusing the
+        # precomputed delta instead of reconstructing it from the two
+        # tail segments
         tail = self.snake[0]
-        second_last = self.snake[1]
-
-        # Calculate direction of tail growth
-        growth_x = tail[0] - second_last[0]
-        growth_y = tail[1] - second_last[1]
-
-        new_tail = (tail[0] + growth_x, tail[1] + growth_y)
-        self.snake.insert(0, new_tail)
+        dx, dy = DIRECTION_DELTAS[self.direction]
+        new_tail = (tail[0] - dx, tail[1] - dy)
+        if new_tail in self.snake_set:
+            self._dup_cells += 1
+        self.snake.appendleft(new_tail)
+        self.snake_set.add(new_tail)
+        self.free_cells.discard(new_tail)
+        self._ach_dirty = True
 
     def check_power_up_collision(self):
         """Check if snake collects a power-up."""
         head = self.snake[-1]
 
-        for power_up in self.power_ups[:]:
-            if head == (power_up.x, power_up.y):
-                # Play power-up sound
-                self.sound_manager.play_sound('power_up')
+        # Single hash probe instead of a scan over a copy of the list
+        power_up = self._power_ups_by_pos.pop(head, None)
+        if power_up is None:
+            return False
 
-                # Apply the power-up effect
-                power_up.apply_effect(self)
+        # Play power-up sound
+        self.sound_manager.play_sound('power_up')
 
-                # Track achievement
-                self.achievements['power_ups_collected'] = self.achievements.get('power_ups_collected', 0) + 1
+        # Apply the power-up effect
+        power_up.apply_effect(self)
 
-                # Remove the power-up
-                self.power_ups.remove(power_up)
+        # Track achievement
+        self.achievements['power_ups_collected'] = self.achievements.get('power_ups_collected', 0) + 1
+        self._ach_dirty = True
 
-                return True
+        # Remove the power-up by swapping the last entry into its slot
+        pus = self.power_ups
+        last = pus[-1]
+        pus[power_up.index] = last
+        last.index = power_up.index
+        pus.pop()
 
-        return False
+        return True
 
     def check_collision(self):
         """Check for collisions with walls, self, and obstacles."""
         head = self.snake[-1]
 
-        # Log position
-        logging.info(f"Checking collision for head position: {head}")
-
-        # Power-Up Collision
-        for power_up in self.power_ups:
-            if head == (power_up.x, power_up.y):
-                logging.info(f"Power-up collected at {power_up.x, power_up.y}")
-
         # Wall Collision
         if head[0] < 0 or head[0] >= GameConfig.SCREEN_WIDTH or \
         head[1] < 0 or head[1] >= GameConfig.SCREEN_HEIGHT:
             logging.warning("Wall collision detected!")
             return self.handle_collision()
 
-        # Self Collision
-        if head in self.snake[:-1]:
+        # Self Collision, recorded by move_snake before the head was
+        # added to the shadow set — a single flag instead of a body scan
+        if self._self_collision:
             logging.warning("Self collision detected!")
             return self.handle_collision()
 
         # Obstacle Collision
-        if self.obstacles and head in self.obstacles:
+        if self._obstacle_set and head in self._obstacle_set:
             logging.warning("Obstacle collision detected!")
             return self.handle_collision()
 
@@ -1033,10 +1445,11 @@ class SnakeGame:
     def handle_collision(self):
         """Handle snake collision, reduce lives or end game."""
         self.lives -= 1
+        self._ach_dirty = True
 
         # Reset speed to initial speed when losing a life
         # Use the initial speed from gameplay configuration
-        self.current_speed = self.config['gameplay']['initial_speed']
+        self.current_speed = self.gameplay_cfg.initial_speed
 
         if self.lives <= 0:
             # Game Over
@@ -1051,16 +1464,24 @@ class SnakeGame:
         center_x = GameConfig.SCREEN_WIDTH // 2
         center_y = GameConfig.SCREEN_HEIGHT // 2
 
-        self.snake = [
+        self.snake = deque([
             (center_x - GameConfig.BLOCK_SIZE * 2, center_y),
             (center_x - GameConfig.BLOCK_SIZE, center_y),
             (center_x, center_y)
-        ]
-        self.direction = 'RIGHT'
+        ])
+        self.snake_set = set(self.snake)
+        self._self_collision = False
+        self._dup_cells = 0
+        self._board_cells = _all_cells(
+            GameConfig.GRID_COLS, GameConfig.GRID_ROWS, GameConfig.BLOCK_SIZE)
+        self.free_cells = set(self._board_cells)
+        self.free_cells -= self.snake_set
+        self.direction = RIGHT
 
         # Generate new apple and reset power-ups
         self.apple = self.generate_apple()
         self.power_ups = []
+        self._power_ups_by_pos = {}
 
         return True
 
@@ -1068,30 +1489,34 @@ class SnakeGame:
         """Display high scores screen."""
         high_scores = HighScoreManager.get_high_scores()
 
-        while True:
-            self.screen.fill(Colors.BLACK)
+        # Full-screen draw: force a full repaint when play resumes
+        self._prev_dirty = None
 
-            # High Scores Title
-            title = self.title_font.render('High Scores', True, Colors.GREEN)
-            title_rect = title.get_rect(center=(GameConfig.SCREEN_WIDTH//2, 100))
-            self.screen.blit(title, title_rect)
+        # Scores are static on this screen: render everything once and
+        # collect (surface, dest) pairs for a single blits call per frame
+        blits = []
 
-            # Display high scores
-            for i, score_entry in enumerate(high_scores[:10], 1):
-                score_text = self.font.render(
-                    f"{i}. {score_entry['name']}: {score_entry['score']}",
-                    True,
-                    Colors.WHITE
-                )
-                score_rect = score_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, 200 + i*40))
-                self.screen.blit(score_text, score_rect)
+        title = self._render_cached(self.title_font, 'High Scores', Colors.GREEN)
+        blits.append((title, title.get_rect(center=(GameConfig.SCREEN_WIDTH//2, 100))))
+
+        for i, score_entry in enumerate(high_scores[:10], 1):
+            score_text = self.font.render(
+                f"{i}. {score_entry['name']}: {score_entry['score']}",
+                True,
+                Colors.WHITE
+            )
+            blits.append((score_text, score_text.get_rect(
+                center=(GameConfig.SCREEN_WIDTH//2, 200 + i*40))))
 
-            # Back instructions
-            back_text = self.small_font.render('Press SPACE to go back', True, Colors.GRAY)
-            back_rect = back_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT - 100))
-            self.screen.blit(back_text, back_rect)
+        back_text = self._render_cached(self.small_font, 'Press SPACE to go back', Colors.GRAY)
+        blits.append((back_text, back_text.get_rect(
+            center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT - 100))))
 
+        while True:
+            self.screen.fill(Colors.BLACK)
+            self.screen.blits(blits)
             pygame.display.update()
+            self.clock.tick(30)  # Static screen; no need to spin faster
 
             # Handle events
             for event in pygame.event.get():
@@ -1104,15 +1529,18 @@ class SnakeGame:
 
     def draw_start_screen(self):
         """Render the start screen."""
+        # Full-screen draw: force a full repaint when play resumes
+        self._prev_dirty = None
         self.screen.fill(Colors.BLACK)
 
-        # Title
-        title = self.title_font.render('Snake Game', True, Colors.GREEN)
+        # Title; the text is static, so every render below goes through
+        # the surface cache and only rasterizes once
+        title = self._render_cached(self.title_font, 'Snake Game', Colors.GREEN)
         title_rect = title.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 150))
         self.screen.blit(title, title_rect)
 
         # Difficulty selection
-        difficulty_text = self.font.render(f'Difficulty: {list(self.config.keys())[0]}', True, Colors.WHITE)
+        difficulty_text = self._render_cached(self.font, f'Difficulty: {self.difficulty}', Colors.WHITE)
         difficulty_rect = difficulty_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 50))
         self.screen.blit(difficulty_text, difficulty_rect)
 
@@ -1128,102 +1556,82 @@ class SnakeGame:
         ]
 
         for i, line in enumerate(instructions):
-            text = self.font.render(line, True, Colors.WHITE)
+            text = self._render_cached(self.font, line, Colors.WHITE)
             text_rect = text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 + i*40))
             self.screen.blit(text, text_rect)
 
         pygame.display.update()
 
-    def draw_game_over_screen(self):
-        """Render an enhanced game over screen with interactive elements."""
-        # Create a semi-transparent overlay
-        overlay = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Transparent black
-        self.screen.blit(overlay, (0, 0))
-
-        # Game Over Title with pulsing effect
-        current_time = pygame.time.get_ticks()
-        pulse_scale = 1 + 0.1 * math.sin(current_time * 0.01)
-
-        game_over_font = pygame.font.Font(None, int(64 * pulse_scale))
-        game_over = game_over_font.render('GAME OVER', True, Colors.RED)
-        game_over_rect = game_over.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 220))
+    def _build_gameover_bg(self):
+        """Compose the static game-over elements into a single surface.
 
-        # Rotate game over text slightly for dynamic effect
-        rotated_game_over = pygame.transform.rotate(game_over, math.sin(current_time * 0.01) * 5)
-        rotated_rect = rotated_game_over.get_rect(center=game_over_rect.center)
-        self.screen.blit(rotated_game_over, rotated_rect)
-
-        # Score Display with shadow effect
-        score_font = pygame.font.Font(None, 48)
+        Overlay, scores and base button labels only change when the
+        score or high score does, so they are baked together once and
+        the frame loop pays a single blit for all of them. Button rects
+        are recorded for hover and click handling.
+        """
+        bg = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT), pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 200))  # Transparent black
 
-        # Shadow effect
-        shadow_score = score_font.render(f'Your Score: {self.score}', True, Colors.GRAY)
-        self.screen.blit(shadow_score, (GameConfig.SCREEN_WIDTH//2 - shadow_score.get_width()//2 + 3,
-                                    GameConfig.SCREEN_HEIGHT//2 - 120 + 3))
+        # Score display with shadow effect
+        shadow_score = self._render_cached(self.score_font, f'Your Score: {self.score}', Colors.GRAY)
+        bg.blit(shadow_score, (GameConfig.SCREEN_WIDTH//2 - shadow_score.get_width()//2 + 3,
+                               GameConfig.SCREEN_HEIGHT//2 - 120 + 3))
 
         # Actual score
-        score_text = score_font.render(f'Your Score: {self.score}', True, Colors.WHITE)
-        score_rect = score_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 120))
-        self.screen.blit(score_text, score_rect)
+        score_text = self._render_cached(self.score_font, f'Your Score: {self.score}', Colors.WHITE)
+        bg.blit(score_text, score_text.get_rect(
+            center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 120)))
 
         # High Score
-        high_score_text = score_font.render(f'High Score: {self.high_score}', True, Colors.GOLD)
-        high_score_rect = high_score_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 70))
-        self.screen.blit(high_score_text, high_score_rect)
+        high_score_text = self._render_cached(self.score_font, f'High Score: {self.high_score}', Colors.GOLD)
+        bg.blit(high_score_text, high_score_text.get_rect(
+            center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 70)))
 
-        # Interactive Buttons
-        button_font = pygame.font.Font(None, 36)
+        # Interactive buttons; rects double as the click targets
         button_y_start = GameConfig.SCREEN_HEIGHT//2
+        self.game_over_buttons = {}
+        for name, label, color, dy in _GAMEOVER_BUTTONS:
+            text = self._render_cached(self.font, label, color)
+            rect = text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, button_y_start + dy))
+            bg.blit(text, rect)
+            self.game_over_buttons[name] = rect
 
-        # Restart Button
-        restart_text = button_font.render('Restart Game', True, Colors.GREEN)
-        restart_rect = restart_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, button_y_start + 10))
+        return bg
 
-        # High Scores Button
-        high_scores_text = button_font.render('View High Scores', True, Colors.BLUE)
-        high_scores_rect = high_scores_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, button_y_start + 50))
-
-        # Achievements Button
-        achievements_text = button_font.render('View Achievements', True, Colors.GOLD)
-        achievements_rect = achievements_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, button_y_start + 80))
+    def draw_game_over_screen(self):
+        """Render an enhanced game over screen with interactive elements."""
+        # Static parts are composed once per (score, high score) pair;
+        # each frame is then one background blit plus the animated title
+        # and any hover swaps on top
+        key = (self.score, self.high_score)
+        if self._gameover_bg is None or self._gameover_bg[0] != key:
+            self._gameover_bg = (key, self._build_gameover_bg())
+        self.screen.blit(self._gameover_bg[1], (0, 0))
+
+        # Full-screen draw: force a full repaint when play resumes
+        self._prev_dirty = None
+
+        # Game Over Title with pulsing effect. The text is rendered once
+        # through the surface cache; the pulse and wobble are applied by
+        # rotozoom, which scales and rotates in a single pass instead of
+        # constructing a new Font and re-rendering every frame.
+        current_time = pygame.time.get_ticks()
+        pulse_scale = 1 + 0.1 * math.sin(current_time * 0.01)
 
-        # Exit Button
-        exit_text = button_font.render('Exit Game', True, Colors.RED)
-        exit_rect = exit_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, button_y_start + 110))
+        game_over = self._render_cached(self.title_font, 'GAME OVER', Colors.RED)
+        rotated_game_over = pygame.transform.rotozoom(
+            game_over, math.sin(current_time * 0.01) * 5, pulse_scale)
+        rotated_rect = rotated_game_over.get_rect(
+            center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2 - 220))
+        self.screen.blit(rotated_game_over, rotated_rect)
 
-        # Hover effects
+        # Hovered buttons get their cached white variant blitted on top
         mouse_pos = pygame.mouse.get_pos()
-
-        # Restart button hover
-        if restart_rect.collidepoint(mouse_pos):
-            restart_text = button_font.render('Restart Game', True, Colors.WHITE)
-
-        # High Scores button hover
-        if high_scores_rect.collidepoint(mouse_pos):
-            high_scores_text = button_font.render('View High Scores', True, Colors.WHITE)
-
-        # Achievements button hover
-        if achievements_rect.collidepoint(mouse_pos):
-            achievements_text = button_font.render('View Achievements', True, Colors.WHITE)
-
-        # Exit button hover
-        if exit_rect.collidepoint(mouse_pos):
-            exit_text = button_font.render('Exit Game', True, Colors.WHITE)
-
-        # Blit buttons
-        self.screen.blit(restart_text, restart_rect)
-        self.screen.blit(high_scores_text, high_scores_rect)
-        self.screen.blit(achievements_text, achievements_rect)
-        self.screen.blit(exit_text, exit_rect)
-
-        # Store button rects for click handling
-        self.game_over_buttons = {
-            'restart': restart_rect,
-            'high_scores': high_scores_rect,
-            'achievements': achievements_rect,
-            'exit': exit_rect
-        }
+        for name, label, _color, _dy in _GAMEOVER_BUTTONS:
+            rect = self.game_over_buttons[name]
+            if rect.collidepoint(mouse_pos):
+                self.screen.blit(self._render_cached(self.font, label, Colors.WHITE), rect)
 
         pygame.display.update()
 
@@ -1270,11 +1678,17 @@ class SnakeGame:
 
             # Start challenge mode with adjusted settings
             self.challenge_mode = adjusted_settings
+            self.challenge_start_time = pygame.time.get_ticks()
+            self._challenge_deadline = self.challenge_start_time + self.challenge_mode['time_limit'] * 1000
 
             # Optional: Notify player about challenge mode
             self.show_challenge_notification()
 
         while True:
+            # One SDL clock read per iteration; everything downstream
+            # (movement timers, deadline check, draw flash) reads this
+            self._now = pygame.time.get_ticks()
+
             # Handle events
             self.handle_events()
 
@@ -1290,12 +1704,17 @@ class SnakeGame:
                 continue
 
             elif self.game_state == 'PAUSED':
-                # Existing pause screen logic
-                pause_overlay = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT), pygame.SRCALPHA)
-                pause_overlay.fill((128, 128, 128, 128))
-                self.screen.blit(pause_overlay, (0, 0))
-
-                pause_text = self.title_font.render('PAUSED', True, Colors.WHITE)
+                # Existing pause screen logic; the overlay is allocated
+                # once and reused across paused frames. The full-screen
+                # overlay invalidates the dirty-rect history, so the
+                # first frame after resuming repaints everything.
+                self._prev_dirty = None
+                if self._pause_overlay is None:
+                    self._pause_overlay = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT), pygame.SRCALPHA)
+                    self._pause_overlay.fill((128, 128, 128, 128))
+                self.screen.blit(self._pause_overlay, (0, 0))
+
+                pause_text = self._render_cached(self.title_font, 'PAUSED', Colors.WHITE)
                 pause_rect = pause_text.get_rect(center=(GameConfig.SCREEN_WIDTH//2, GameConfig.SCREEN_HEIGHT//2))
                 self.screen.blit(pause_text, pause_rect)
 
@@ -1313,12 +1732,8 @@ class SnakeGame:
 
             # Challenge mode specific logic
             if self.challenge_mode:
-                # Check time limit
-                current_time = pygame.time.get_ticks()
-                time_elapsed = (current_time - self.challenge_start_time) / 1000  # Convert to seconds
-
-                # Check if time limit exceeded
-                if time_elapsed > self.challenge_mode['time_limit']:
+                # Check time limit against the precomputed deadline
+                if self._now > self._challenge_deadline:
                     print("Challenge Mode: Time Limit Exceeded!")
                     self.game_state = 'GAME_OVER'
                     continue
@@ -1368,8 +1783,20 @@ class SnakeGame:
 
 def main():
     """Entry point of the game."""
+    parser = argparse.ArgumentParser(description='Snake Game')
+    parser.add_argument(
+        '--config-set',
+        action='append',
+        default=[],
+        metavar='SECTION.KEY=VALUE',
+        help='Apply a configuration override non-interactively (repeatable), e.g. screen.width=1024'
+    )
+    args = parser.parse_args()
+
+    overrides = parse_config_overrides(args.config_set) if args.config_set else None
+
     # You could add difficulty selection logic here in the future
-    game = SnakeGame(difficulty='MEDIUM')
+    game = SnakeGame(difficulty='MEDIUM', config_overrides=overrides)
     game.run()
 
 if __name__ == '__main__':